@@ -66,7 +66,7 @@ After the "Let's Get Organized" button, add the new "Search Catalogs" button:
 In the FileOrganizerPro class, add this new method:
 
     def open_catalog_search(self):
-        """Open the multi-catalog search dialog"""
+        '''Open the multi-catalog search dialog'''
         try:
             dialog = CatalogSearchDialog(self)
             dialog.exec()